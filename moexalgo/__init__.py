@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union
 
 from .tickers import _Ticker, _resolve_ticker
@@ -19,9 +20,15 @@ from .indices import Index
 from .currency import Currency
 from .futures import Futures
 from .utils import CandlePeriod
+from . import session
 
 AnyTickers = Union['Stock', 'Index', 'Currency', 'Futures']
 
+# Класс инструмента по пути рынка (`engines/{engine}/markets/{market}`)
+_TICKER_CLASSES = dict((item._PATH, item) for item in [Currency, Futures, Index, Stock])
+# Количество одновременных запросов описаний инструментов в `Tickers`
+_RESOLVE_WORKERS = 16
+
 
 def Ticker(secid: str, boardid: str = None) -> AnyTickers:
     """
@@ -65,7 +72,49 @@ def Ticker(secid: str, boardid: str = None) -> AnyTickers:
     """
     if info := _resolve_ticker(secid, boardid):
         secid, boardid, market, engine, *args = info
-        allowed_tickers = dict((item._PATH, item) for item in [Currency, Futures, Index, Stock])
-        if allowed_ticker := allowed_tickers.get(f'engines/{engine}/markets/{market}'):
+        if allowed_ticker := _TICKER_CLASSES.get(f'engines/{engine}/markets/{market}'):
             return allowed_ticker(*info)
     raise LookupError(f"Cannot found ticker: `{secid}`")
+
+
+# `Ticker` - фабрика, поэтому очистка кеша инструментов доступна как `Ticker.cache_clear()`
+Ticker.cache_clear = _Ticker.cache_clear
+
+
+def Tickers(*secids: str) -> list[AnyTickers]:
+    """
+    Получение объектов финансовых инструментов по списку тикеров.
+
+    Объекты создаются так же, как в `Ticker`, но одновременно (не более `_RESOLVE_WORKERS` запросов).
+    Повторяющиеся тикеры запрашиваются один раз и возвращаются одним и тем же объектом.
+
+    Parameters
+    ----------
+    secids : str
+        Тикеры финансовых инструментов, например "GAZP" или "SBER.TQBR".
+
+    Returns
+    -------
+    return : list[AnyTickers]
+        Объекты инструментов в порядке следования тикеров.
+
+    Raises
+    ------
+    LookupError
+        Исключение возникает, если какой-либо тикер не найден.
+
+    Example
+    -------
+    .. code-block:: python
+
+        >>> sber, gazp, imoex = Tickers("SBER", "GAZP", "IMOEX")
+    """
+    unique = list(dict.fromkeys(secids))
+    if len(unique) > 1:
+        # Общая сессия создается до запуска потоков, чтобы они использовали один клиент
+        with session.shared_session():
+            with ThreadPoolExecutor(max_workers=min(_RESOLVE_WORKERS, len(unique))) as executor:
+                tickers = dict(zip(unique, executor.map(Ticker, unique)))
+    else:
+        tickers = {secid: Ticker(secid) for secid in unique}
+    return [tickers[secid] for secid in secids]
@@ -1,5 +1,4 @@
 import asyncio
-import json
 import typing as t
 import uuid
 from collections import deque
@@ -8,6 +7,11 @@ from contextlib import asynccontextmanager
 import websockets
 from stomp.utils import Frame, convert_frame, parse_frame
 
+from moexalgo.utils import json
+
+# Разбор JSON кадров подписки, связывается один раз при импорте
+_loads = json.loads
+
 
 class Credentials(t.NamedTuple):
     """ Auth credentials """
@@ -33,6 +37,21 @@ class Subscription(t.AsyncIterator):
             raise result
         return result
 
+    async def batches(self) -> t.AsyncIterator[list]:
+        """ Batches of subscription data: everything queued by the time the consumer asks """
+        while True:
+            while not len(self._queue):
+                await asyncio.sleep(0.1)
+            batch = []
+            while self._queue and not isinstance(self._queue[0], Exception):
+                batch.append(self._queue.popleft())
+            if batch:
+                yield batch
+            elif isinstance(error := self._queue.popleft(), StopAsyncIteration):
+                return
+            else:
+                raise error
+
 
 class ISSPlusSTOMP:
     """ ISS+ STOMP Client """
@@ -54,7 +73,7 @@ class ISSPlusSTOMP:
         async for message in self._wscp:
             frame = parse_frame(message)
             if frame.cmd == 'CONNECTED':
-                self.structure = json.loads(frame.body.decode('utf8').strip('\0'))['structure']
+                self.structure = _loads(frame.body.strip(b'\0'))['structure']
                 self._task = asyncio.create_task(self._listener(), name="Message listener")
                 return self
             raise ConnectionRefusedError(f"STOMP authentication failed; {frame.headers['message']}")
@@ -113,7 +132,7 @@ class ISSPlusSTOMP:
                             future.set_exception(
                                 RuntimeError(f"Request {request_id} failed: {frame.headers['message']}"))
                         else:
-                            future.set_result(json.loads(frame.body.decode('utf8').strip('\0')))
+                            future.set_result(_loads(frame.body.strip(b'\0')))
                     else:
                         assert False, f"Cannot found pending for request: {request_id}"
                 elif subscription_id := frame.headers.get('subscription', frame.headers.get('receipt-id')):
@@ -123,9 +142,9 @@ class ISSPlusSTOMP:
                                 RuntimeError(f"Subscription {subscription_id} failed: {frame.headers['message']}"))
                             self._pending.pop(subscription_id, None)
                         else:
-                            data = frame.body.decode('utf8').strip('\0')
+                            data = frame.body.strip(b'\0')
                             if data:
-                                subscription._append(json.loads(data))
+                                subscription._append(_loads(data))
                     else:
                         assert False, f"Cannot found pending for subscription: {subscription_id}"
                 else:
@@ -1,17 +1,33 @@
 from __future__ import annotations
 
 from datetime import date
+from itertools import starmap
+from operator import itemgetter
 from typing import Union, Iterator
 
-import pandas as pd
-
-from moexalgo.metrics import calc_offset_limit, prepare_from_till_dates
+from moexalgo.metrics import calc_offset_limit, columns_frame, prepare_from_till_dates
 from moexalgo.models import Candle
 from moexalgo.session import Session, data_gen
-from moexalgo.utils import CandlePeriod
-
-
-def pandas_frame(candles_it: iter) -> pd.DataFrame:
+from moexalgo.utils import CandlePeriod, pd
+
+# Значения полей свечи в порядке полей `Candle`
+_CANDLE_VALUES = itemgetter(*Candle._fields)
+# Допустимые числовые значения периода, совпадают с интервалом свечей
+_INTERVALS = frozenset(period.value for period in CandlePeriod)
+# Интервалы свечей по строковому обозначению периода
+_PERIODS = {
+    '1min': CandlePeriod.ONE_MINUTE.value,
+    '10min': CandlePeriod.TEN_MINUTES.value,
+    '1h': CandlePeriod.ONE_HOUR.value,
+    '1d': CandlePeriod.ONE_DAY.value,
+    '1w': CandlePeriod.ONE_WEEK.value,
+    '1m': CandlePeriod.ONE_MONTH.value
+}
+# Периоды, для которых за один день бывает не больше одной свечи
+_DAILY_INTERVALS = frozenset((CandlePeriod.ONE_DAY.value, CandlePeriod.ONE_WEEK.value, CandlePeriod.ONE_MONTH.value))
+
+
+def pandas_frame(candles_it: iter, dtypes: dict[str, str] = None) -> pd.DataFrame:
     """
     Преобразование итератора свечей в `pd.DataFrame`.
 
@@ -19,6 +35,8 @@ def pandas_frame(candles_it: iter) -> pd.DataFrame:
     ----------
     candles_it : iter
         Итератор свечей.
+    dtypes : dict[str, str], optional
+        Типы числовых столбцов, by default None.
     
     Returns
     -------
@@ -26,9 +44,9 @@ def pandas_frame(candles_it: iter) -> pd.DataFrame:
         Данные в формате `pd.DataFrame`.
     """
 
-    def _make_lower_keys(dct_: dict) -> dict:
+    def _lower_keys(dct_: dict) -> dict[str, str]:
         """
-        Преобразование ключей словаря в нижний регистр.
+        Имена столбцов в нижнем регистре.
 
         Parameters
         ----------
@@ -37,12 +55,12 @@ def pandas_frame(candles_it: iter) -> pd.DataFrame:
         
         Returns
         -------
-        return : dict
-            Словарь с ключами в нижнем регистре.
+        return : dict[str, str]
+            Соответствие имени столбца в нижнем регистре ключу словаря.
         """
-        return {key.lower(): value for (key, value) in dct_.items()}
+        return {key.lower(): key for key in dct_}
 
-    return pd.DataFrame([_make_lower_keys(dct) for dct in candles_it])
+    return columns_frame(candles_it, _lower_keys, dtypes)
 
 
 def dataclass_it(candles_it: iter) -> iter[Candle]:
@@ -59,8 +77,7 @@ def dataclass_it(candles_it: iter) -> iter[Candle]:
     return : iter[Candle]
         Итератор свечей в формате `Candle`.
     """
-    for candle in candles_it:
-        yield Candle(**candle)
+    return starmap(Candle, map(_CANDLE_VALUES, candles_it))
 
 
 def prepare_request(cs: Session, 
@@ -129,35 +146,13 @@ def prepare_request(cs: Session,
         interval_seconds = period.value
     
     elif isinstance(period, int):
-        if period == 1:
-            interval_seconds = CandlePeriod.ONE_MINUTE.value
-        elif period == 10:
-            interval_seconds = CandlePeriod.TEN_MINUTES.value
-        elif period == 60:
-            interval_seconds = CandlePeriod.ONE_HOUR.value
-        elif period == 24:
-            interval_seconds = CandlePeriod.ONE_DAY.value
-        elif period == 7:
-            interval_seconds = CandlePeriod.ONE_WEEK.value
-        elif period == 31:
-            interval_seconds = CandlePeriod.ONE_MONTH.value
-        else:
+        if period not in _INTERVALS:
             _raise_error()
+        # `bool` тоже `int`: `True` передается в запрос как 1, а не как `true`
+        interval_seconds = int(period)
     
     elif isinstance(period, str):
-        if period == '1min':
-            interval_seconds = CandlePeriod.ONE_MINUTE.value
-        elif period == '10min':
-            interval_seconds = CandlePeriod.TEN_MINUTES.value
-        elif period == '1h':
-            interval_seconds = CandlePeriod.ONE_HOUR.value
-        elif period == '1d':
-            interval_seconds = CandlePeriod.ONE_DAY.value
-        elif period == '1w':
-            interval_seconds = CandlePeriod.ONE_WEEK.value
-        elif period == '1m':
-            interval_seconds = CandlePeriod.ONE_MONTH.value
-        else:
+        if (interval_seconds := _PERIODS.get(period)) is None:
             _raise_error()
 
     elif period is None:
@@ -179,6 +174,9 @@ def prepare_request(cs: Session,
     if latest:
         options['iss.reverse'] = True
         limit = 1
+    elif from_date == till_date and interval_seconds in _DAILY_INTERVALS:
+        # Достаточно первой страницы, без определения размера страницы и упреждающих запросов
+        limit = -1
 
     path = f'{path}/boards/{boardid}/securities/{secid}/candles'
     return data_gen(cs, path, options, offset, limit, 'candles')
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Union
-
-import pandas as pd
+from typing import TYPE_CHECKING, Union
 
 from moexalgo.metrics import prepare_request, dataclass_it, pandas_frame
 from moexalgo.session import Session
 from moexalgo.tickers import _Ticker, _resolve_ticker
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class Currency(_Ticker):
     """ 
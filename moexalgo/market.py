@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import re
 from datetime import date
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 
 from moexalgo import session
-from moexalgo.metrics import prepare_market_request, dataclass_it, pandas_frame
+from moexalgo.metrics import FUTOI_DTYPES, prepare_market_request, columns_frame, dataclass_it, pandas_frame
 from moexalgo.session import Session, data_gen
 from moexalgo.utils import result_deserializer, pd
 
@@ -31,6 +31,8 @@ _ALIASES = {
     'FO': ('engines/futures/markets/forts', 'RFUD'),
     'futures': ('engines/futures/markets/forts', 'RFUD'),
 }
+# Префикс метрик (`eq`, `fx`, `fo`) для пути рынка, берется из первого двухбуквенного псевдонима
+_PREFS = {path: alias.lower() for alias, (path, _) in reversed(_ALIASES.items()) if len(alias) == 2}
 
 
 def market_for(secid: str, boardid: str, cs: Session = None) -> Optional[Market]:
@@ -124,6 +126,41 @@ class Market:
     _values: dict[str, dict[str, dict]] = None
     _delisted: list[str] = None
     _LIMIT = 25_000
+    # Поля, которые по умолчанию выдаются для каждого раздела данных о рынке
+    _DEFAULT_FIELDS = {
+        'securities': (
+            'SHORTNAME',  # Краткое наименование
+            'LOTSIZE',  # Размер лота
+            'DECIMALS',  # Количество знаков после запятой
+            'MINSTEP',  # Минимальный шаг цены
+            'ISSUESIZE',  # Объем выпуска
+            'ISIN',  # Стандартное наименование
+            'REGNUMBER',  # Регистрационный номер
+            'LISTLEVEL'  # Уровень листинга
+        ),
+        'marketdata': (
+            'BID',  # Лучшая цена покупки
+            'OFFER',  # Лучшая цена продажи
+            'BIDDEPTHT',  # Глубина стакана покупки
+            'OFFERDEPTHT',  # Глубина стакана продажи
+            'OPEN',  # Цена открытия
+            'HIGH',  # Максимальная цена
+            'LOW',  # Минимальная цена
+            'LAST',  # Цена последней сделки
+            'WAPRICE',  # Средневзвешенная цена
+            'LASTTOPREVPRICE',  # Изменение цены последней сделки к предыдущей
+            'NUMTRADES',  # Количество сделок
+            'VOLTODAY',  # Объем сделок за день
+            'VALTODAY',  # Объем сделок за день в валюте
+            'VALTODAY_USD',  # Объем сделок за день в долларах
+            'OPENPERIODPRICE',  # Цена открытия периода
+            'CLOSINGAUCTIONPRICE',  # Цена закрытия аукциона
+            'CLOSINGAUCTIONVOLUME',  # Объем закрытия аукциона
+            'ISSUECAPITALIZATION',  # Капитализация
+            'UPDATETIME',  # Время обновления
+            'SYSTIME'  # Время системы
+        ),
+    }
 
     def __new__(cls, name: str, boardid: str = None) -> Market:
         """
@@ -167,13 +204,11 @@ class Market:
             raise NotImplementedError(f"Market {name} is not supported")
 
         market = _AVAILABLE.setdefault(name, dict())
-        prefs = [k for k, v in _ALIASES.items() if v[0].startswith(path) and len(k) == 2]
-        pref = prefs[0].lower() if prefs else None
         if boardid not in market:
             market[boardid] = super().__new__(cls)
             market[boardid]._name = name
             market[boardid]._path = path
-            market[boardid]._pref = pref
+            market[boardid]._pref = _PREFS.get(path)
             market[boardid]._boardid = boardid
 
         return market[boardid]
@@ -196,7 +231,7 @@ class Market:
         return : None
         """
         if self._fields is None or self._values is None:
-            with Session(cs or session.default) as client:
+            with session.shared_session(cs) as client:
                 self._fields = client.get_objects(
                     f'{self._path}/boards/{self._boardid}/securities/columns',
                     lambda data: result_deserializer(data, key=lambda item: item['name']))
@@ -245,26 +280,30 @@ class Market:
         # if self._is_delisted(secid):
         #     return dict(securities=None, marketdata=None)
 
-    def _normalize_row(self, row: dict[str, dict], fields: tuple[str]) -> dict[str, dict]:
+    @staticmethod
+    def _columns_for(fields: tuple[str]) -> Callable[[dict], dict[str, str]]:
         """
-        Нормализует строку данных о статистике инструмента.
+        Создает функцию выбора столбцов данных о статистике инструментов.
+
+        Все строки ответа ISS имеют одинаковый набор столбцов, поэтому соответствие
+        имен столбцов ключам строки вычисляется один раз, по первой строке.
 
         Parameters
         ----------
-        row : Dict[str, Any]
-            Строка данных о статистике инструмента.
         fields : Tuple[str]
             Поля, которые необходимо оставить в строке данных.
 
         Returns
         -------
-        return : Dict[str, Any]
-            Нормализованная строка данных о статистике инструмента.
+        return : Callable[[Dict[str, Any]], Dict[str, str]]
+            Функция, возвращающая соответствие `имя столбца -> ключ строки`.
         """
-        return dict(
-            ticker=row['SECID'],
-            **{key.lower(): value for key, value in row.items() if key in fields}
-        )
+        names = {key: key.lower() for key in fields}
+
+        def columns_for(row: dict[str, dict]) -> dict[str, str]:
+            return dict(ticker='SECID', **{names[key]: key for key in row if key in names})
+
+        return columns_for
 
     def _get_data(self,
                   option: str,
@@ -284,7 +323,7 @@ class Market:
             Изменяет тип возвращаемого объекта, by default `True`.
             Если `True`, то возвращает `pd.DataFrame`, иначе список.
         fields : Tuple[str], optional
-            Поля, которые необходимо оставить в строке данных.
+            Поля, которые необходимо оставить в строке данных, by default поля из `_DEFAULT_FIELDS`.
         
         Returns
         -------
@@ -293,9 +332,8 @@ class Market:
         """
         self._ensure_loaded(cs)
         if use_dataframe:
-            return pd.DataFrame(
-                [self._normalize_row(row, fields) for row in self._values[option].values()]
-            )
+            fields = fields or self._DEFAULT_FIELDS.get(option, ())
+            return columns_frame(self._values[option].values(), self._columns_for(fields))
         else:
             return list(self._values[option].values())
 
@@ -316,18 +354,7 @@ class Market:
         return : Union[list[dict], pd.DataFrame]
             Объекты типа List или `pd.DataFrame`.
         """
-        fields = (
-            'SHORTNAME',  # Краткое наименование
-            'LOTSIZE',  # Размер лота
-            'DECIMALS',  # Количество знаков после запятой
-            'MINSTEP',  # Минимальный шаг цены
-            'ISSUESIZE',  # Объем выпуска
-            'ISIN',  # Стандартное наименование
-            'REGNUMBER',  # Регистрационный номер
-            'LISTLEVEL'  # Уровень листинга
-        )
-
-        return self._get_data('securities', cs, use_dataframe, fields)
+        return self._get_data('securities', cs, use_dataframe)
 
     def marketdata(self, cs: Session = None, use_dataframe: bool = True) -> Union[list[dict], pd.DataFrame]:
         """ 
@@ -346,30 +373,7 @@ class Market:
         return : Union[list[dict], pd.DataFrame]
             Объекты типа List или `pd.DataFrame`.
         """
-        fields = (
-            'BID',  # Лучшая цена покупки
-            'OFFER',  # Лучшая цена продажи
-            'BIDDEPTHT',  # Глубина стакана покупки
-            'OFFERDEPTHT',  # Глубина стакана продажи
-            'OPEN',  # Цена открытия
-            'HIGH',  # Максимальная цена
-            'LOW',  # Минимальная цена
-            'LAST',  # Цена последней сделки
-            'WAPRICE',  # Средневзвешенная цена
-            'LASTTOPREVPRICE',  # Изменение цены последней сделки к предыдущей
-            'NUMTRADES',  # Количество сделок
-            'VOLTODAY',  # Объем сделок за день
-            'VALTODAY',  # Объем сделок за день в валюте
-            'VALTODAY_USD',  # Объем сделок за день в долларах
-            'OPENPERIODPRICE',  # Цена открытия периода
-            'CLOSINGAUCTIONPRICE',  # Цена закрытия аукциона
-            'CLOSINGAUCTIONVOLUME',  # Объем закрытия аукциона
-            'ISSUECAPITALIZATION',  # Капитализация
-            'UPDATETIME',  # Время обновления
-            'SYSTIME'  # Время системы
-        )
-
-        return self._get_data('marketdata', cs, use_dataframe, fields)
+        return self._get_data('marketdata', cs, use_dataframe)
 
     def _prepare_metric(self,
                         metric: str,
@@ -379,7 +383,8 @@ class Market:
                         offset: int = None,
                         cs: Session = None,
                         use_dataframe: bool = True,
-                        limit: int = None) -> Union[iter, pd.DataFrame]:
+                        limit: int = None,
+                        dtypes: dict[str, str] = None) -> Union[iter, pd.DataFrame]:
         """
         Подготавливает запрос к рынку по заданным параметрам.
 
@@ -400,6 +405,10 @@ class Market:
         use_dataframe : bool, optional
             Изменяет тип возвращаемого объекта, by default `True`.
             Если `True`, то возвращает `pd.DataFrame`, иначе итератор.
+        limit : int, optional
+            Лимит данных, by default None.
+        dtypes : dict[str, str], optional
+            Типы числовых столбцов `pd.DataFrame`, by default None.
 
         Returns
         -------
@@ -414,7 +423,7 @@ class Market:
             offset=offset,
             limit=limit or 50_000
         )
-        return pandas_frame(metrics_it) if use_dataframe else dataclass_it(metrics_it)
+        return pandas_frame(metrics_it, dtypes) if use_dataframe else dataclass_it(metrics_it)
 
     def tradestats(self,
                    *,
@@ -580,7 +589,8 @@ class Market:
             offset=None,
             cs=cs,
             use_dataframe=use_dataframe,
-            limit=-1
+            limit=-1,
+            dtypes=FUTOI_DTYPES
         )
 
     def alerts(self,
@@ -1,15 +1,74 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Union
-
-import pandas as pd
+from functools import lru_cache
+from time import time
+from typing import Callable, Optional, Union
 
 from moexalgo.session import Session, data_gen
-from moexalgo.utils import ISSTickerParamException, ISSDateParamException
+from moexalgo.utils import ISSTickerParamException, ISSDateParamException, pd
+
+# Типы целочисленных столбцов `FUTOI`, передаются в `pd.DataFrame` без определения типа
+FUTOI_DTYPES = {name: 'int64' for name in ('sess_id', 'seqnum', 'pos', 'pos_long', 'pos_short',
+                                            'pos_long_num', 'pos_short_num')}
+
+
+@lru_cache(maxsize=1)
+def _today(minute: int) -> date:
+    # `minute` меняется раз в минуту, до этого текущая дата берется из кеша
+    return datetime.now().date()
+
+
+def current_date() -> date:
+    """
+    Текущая дата, запрашивается у системы не чаще раза в минуту.
+
+    Returns
+    -------
+    return : date
+        Текущая дата.
+    """
+    return _today(int(time() // 60))
 
 
-def pandas_frame(metrics_it: iter[dict]) -> pd.DataFrame:
+def columns_frame(rows_it: iter[dict],
+                  columns_for: Callable[[dict], dict[str, str]],
+                  dtypes: dict[str, str] = None) -> pd.DataFrame:
+    """
+    Построение `pd.DataFrame` по столбцам, без промежуточного списка словарей.
+
+    Parameters
+    ----------
+    rows_it : iter[dict]
+        Итератор со строками данных.
+    columns_for : Callable[[dict], dict[str, str]]
+        Функция, которая по первой строке возвращает соответствие `имя столбца -> ключ строки`.
+    dtypes : dict[str, str], optional
+        Типы числовых столбцов, by default None.
+        Столбец без пропусков создается сразу с указанным типом, без определения типа в pandas.
+
+    Returns
+    -------
+    return : pd.DataFrame
+        Таблица с данными.
+    """
+    columns = dict()
+    appenders = None
+    for row in rows_it:
+        if appenders is None:
+            names = columns_for(row)
+            columns = {name: [] for name in names}
+            appenders = [(columns[name].append, key) for name, key in names.items()]
+        for append, key in appenders:
+            append(row.get(key))
+    for name, dtype in (dtypes or {}).items():
+        values = columns.get(name)
+        if values is not None and None not in values:
+            columns[name] = pd.Series(values, dtype=dtype)
+    return pd.DataFrame(columns)
+
+
+def pandas_frame(metrics_it: iter[dict], dtypes: dict[str, str] = None) -> pd.DataFrame:
     """
     Трансформация данных из итератора в `pd.DataFrame`.
 
@@ -17,6 +76,8 @@ def pandas_frame(metrics_it: iter[dict]) -> pd.DataFrame:
     ----------
     metrics_it : iter[dict]
         Итератор с данными.
+    dtypes : dict[str, str], optional
+        Типы числовых столбцов, by default None.
 
     Returns
     -------
@@ -24,9 +85,9 @@ def pandas_frame(metrics_it: iter[dict]) -> pd.DataFrame:
         Таблица с данными.
     """
 
-    def normalize_row(row: dict) -> dict:
+    def column_names(row: dict) -> dict[str, str]:
         """
-        Нормализация строки.
+        Имена столбцов для строки данных.
 
         Parameters
         ----------
@@ -35,15 +96,13 @@ def pandas_frame(metrics_it: iter[dict]) -> pd.DataFrame:
 
         Returns
         -------
-        return : dict
-            Нормализованная строка.
+        return : dict[str, str]
+            Соответствие имени столбца ключу строки.
         """
-        return dict(
-            ticker=row.pop('secid', row.pop('ticker', None)), 
-            **{key.lower(): value for key, value in row.items()}
-        )
+        ticker = 'secid' if 'secid' in row else 'ticker'
+        return dict(ticker=ticker, **{key.lower(): key for key in row if key not in ('secid', 'ticker')})
 
-    return pd.DataFrame([normalize_row(row) for row in metrics_it])
+    return columns_frame(metrics_it, column_names, dtypes)
 
 
 class DCls(dict):
@@ -55,9 +114,6 @@ class DCls(dict):
     data : dict
         Словарь с данными.
     """
-    def __init__(self, **data) -> None:
-        super().__init__(**data)
-
     def __getattr__(self, name):
         if name.startswith('_'):
             return self.__getattribute__(name)
@@ -85,7 +141,29 @@ def dataclass_it(metrics_it: iter[dict]) -> iter[DCls]:
     for data in metrics_it:
         data['ts'] = datetime.combine(data.pop('tradedate'), data.pop('tradetime'))
         data.pop('SYSTIME', data.pop('systime', None))
-        yield DCls(**data)
+        # Словарь передается без распаковки `**data`, чтобы не создавать промежуточный словарь аргументов
+        yield DCls(data)
+
+
+def _to_date(value: Union[str, date, None]) -> Optional[date]:
+    """
+    Приведение значения к `date`.
+
+    Parameters
+    ----------
+    value : Union[str, date, None]
+        Дата, строка в формате ISO или `'today'`.
+
+    Returns
+    -------
+    return : Optional[date]
+        Дата или None, если значение не задано.
+    """
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        return current_date() if value == 'today' else date.fromisoformat(value)
+    return None
 
 
 def calc_offset_limit(offset: int = None,
@@ -139,11 +217,37 @@ def prepare_from_till_dates(from_date: Union[str, date] = None,
     if (from_date is None) or (till_date is None):
         raise ISSTickerParamException()
 
-    from_date = date.fromisoformat(from_date) if isinstance(from_date, str) else (from_date or date.today())
+    if isinstance(from_date, str) and isinstance(till_date, str) and till_date != 'today':
+        return _iso_from_till_dates(from_date, till_date)
+    return _from_till_dates(from_date, till_date)
+
+
+def _from_till_dates(from_date: Union[str, date], till_date: Union[str, date]) -> tuple[str, str]:
+    """
+    Приведение дат начала и окончания к строкам в формате ISO.
+
+    Parameters
+    ----------
+    from_date : Union[str, date]
+        Дата начала.
+    till_date : Union[str, date]
+        Дата окончания или `'today'`.
+
+    Returns
+    -------
+    return : tuple[str, str]
+        Кортеж с датами начала и окончания.
+
+    Raises
+    ------
+    ISSDateParamException
+        Вызывается, если дата начала больше даты окончания.
+    """
+    from_date = date.fromisoformat(from_date) if isinstance(from_date, str) else (from_date or current_date())
     if not till_date:
         till_date = from_date
     elif isinstance(till_date, str):
-        till_date = date.today() if till_date == 'today' else date.fromisoformat(till_date)
+        till_date = current_date() if till_date == 'today' else date.fromisoformat(till_date)
     
     if from_date > till_date:
         raise ISSDateParamException()
@@ -151,6 +255,10 @@ def prepare_from_till_dates(from_date: Union[str, date] = None,
     return from_date.isoformat(), till_date.isoformat()
 
 
+# Повторные запросы за те же даты (строками ISO) не разбирают и не проверяют даты заново
+_iso_from_till_dates = lru_cache(maxsize=512)(_from_till_dates)
+
+
 def get_metrics_path(metric: str, secid: str = None) -> str:
     """
     Получение пути к метрике.
@@ -268,15 +376,9 @@ def prepare_market_request(metric: str,
         Итератор с данными.
     """
 
-    date_ = date.today() if (date_ is None) or (date_ == 'today') else date_
-    if isinstance(date_, str):
-        date_ = date.fromisoformat(date_)
-
-    if isinstance(start, str):
-        start = date.fromisoformat(start)
-
-    if isinstance(end, str):
-        end = date.fromisoformat(end)
+    date_ = _to_date(date_) or current_date()
+    start = _to_date(start)
+    end = _to_date(end)
 
     if secid is not None:
         options = {'from': start.isoformat(), 'till': end.isoformat()}
@@ -1,9 +1,8 @@
-from dataclasses import dataclass
 from datetime import time, datetime
+from typing import NamedTuple
 
 
-@dataclass
-class Candle:
+class Candle(NamedTuple):
     """Модель объекта `Свеча`
 
     Attributes
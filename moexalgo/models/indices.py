@@ -1,10 +1,9 @@
-from dataclasses import dataclass
 from datetime import datetime, date, time
 from decimal import Decimal
+from typing import NamedTuple
 
 
-@dataclass
-class Securities:
+class Securities(NamedTuple):
     """ Элемент блока данных `securities`
 
     Attributes
@@ -33,8 +32,7 @@ class Securities:
     calcmode: str
 
 
-@dataclass
-class MarketData:
+class MarketData(NamedTuple):
     """ Элемент блока данных `marketdata`
 
     Attributes
@@ -1,11 +1,10 @@
 # DEPRECATED!
-from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+from typing import NamedTuple
 
 
-@dataclass
-class TradeStat:
+class TradeStat(NamedTuple):
     """ Метрика "Статистика торгов"
 
     Attributes
@@ -76,8 +75,7 @@ class TradeStat:
     pr_vwap_s: Decimal
 
 
-@dataclass
-class OrderStat:
+class OrderStat(NamedTuple):
     """ Метрика "Статистика заявок"
 
     Attributes
@@ -157,8 +155,7 @@ class OrderStat:
     cancel_vwap_s: Decimal
 
 
-@dataclass
-class ObStat:
+class ObStat(NamedTuple):
     """ Метрика "Стакан стакана заявок"
 
     Attributes
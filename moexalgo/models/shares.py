@@ -1,10 +1,9 @@
-from dataclasses import dataclass
 from datetime import datetime, date, time
 from decimal import Decimal
+from typing import NamedTuple
 
 
-@dataclass
-class Securities:
+class Securities(NamedTuple):
     """ Элемент блока данных `securities`
 
     Attributes
@@ -87,8 +86,7 @@ class Securities:
     settledate: date
 
 
-@dataclass
-class MarketData:
+class MarketData(NamedTuple):
     """ Элемент блока данных `marketdata`
 
     Parameters
@@ -258,8 +256,7 @@ class MarketData:
     tradingsession: str
 
 
-@dataclass
-class OrderBookItem:
+class OrderBookItem(NamedTuple):
     """Активные заявки
 
     Attributes
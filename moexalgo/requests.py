@@ -1,21 +1,51 @@
 import typing as t
+from functools import lru_cache
+from time import time
 
-from moexalgo.session import Session, AUTH_CERT
+from moexalgo.session import shared_session
 from moexalgo.utils import result_deserializer
 
+# Время (в секундах), в течение которого описание инструмента берется из кеша
+_SECURITY_TTL = 600
+
 
 def _get_sections(path: str, *sections: str,
                   session=None, **options: dict) -> t.Optional[t.Iterator[dict]]:
-    with Session(session or Session(auth_cert=AUTH_CERT)) as client:
+    with shared_session(session) as client:
         items = client.get_objects(path, lambda data: result_deserializer(data, *sections), **options)
         return items
 
 
-def get_secid_info_and_boards(secid: int) -> tuple[dict[str, t.Any], dict[str, t.Any]]:
-    with Session(Session(auth_cert=AUTH_CERT)) as client:
-        sections = client.get_objects(f'securities/{secid}',
-                                      lambda data: result_deserializer(data, 'description', 'boards'))
-        return (
-            dict((item.pop('name'), item) for item in sections['description']),
-            dict((item.get('boardid'), item) for item in sections['boards'])
-        )
+def _load_security(secid: str, session=None) -> dict[str, list[dict]]:
+    with shared_session(session) as client:
+        return client.get_objects(f'securities/{secid}',
+                                  lambda data: result_deserializer(data, 'description', 'boards'))
+
+
+@lru_cache(maxsize=4096)
+def _cached_security(secid: str, period: int) -> dict[str, list[dict]]:
+    # `period` меняется раз в `_SECURITY_TTL` секунд, что делает устаревшие записи недоступными
+    return _load_security(secid)
+
+
+def security_period() -> int:
+    return int(time() // _SECURITY_TTL)
+
+
+def get_security(secid: str, session=None) -> dict[str, list[dict]]:
+    if session is None:
+        return _cached_security(secid, security_period())
+    return _load_security(secid, session)
+
+
+def clear_security_cache() -> None:
+    _cached_security.cache_clear()
+
+
+def get_secid_info_and_boards(secid: int, session=None) -> tuple[dict[str, t.Any], dict[str, t.Any]]:
+    sections = get_security(secid, session)
+    return (
+        dict((item['name'], {key: value for key, value in item.items() if key != 'name'})
+             for item in sections['description']),
+        dict((item.get('boardid'), dict(item)) for item in sections['boards'])
+    )
@@ -1,12 +1,31 @@
 from __future__ import annotations
 
 import asyncio
-from time import time, sleep
+import atexit
+import hashlib
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from time import monotonic, sleep
 from typing import Callable, Iterator, Optional, Union
 
 import httpx
 
-from moexalgo.utils import json, result_deserializer
+from moexalgo.utils import RequiredImport, json, result_deserializer
+
+try:
+    import h2  # noqa: F401
+except ImportError:
+    _HTTP2 = False
+else:
+    _HTTP2 = True
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = RequiredImport('diskcache')
 
 BASE_URL = 'https://iss.moex.com/iss'
 TOKEN_URL = 'https://apim.moex.com/iss'
@@ -14,8 +33,161 @@ AUTH_URL = 'https://passport.moex.com/authenticate'
 AUTH_CERT = None
 USE_HTTPS = True
 TOKEN = None
-_NEXT_REQUEST_AT = 0
-_REQUEST_TIMEOUT = 0.1
+CACHE_DIR = None
+_REQUEST_RATE = 5.0
+_REQUEST_BURST = 10
+_BUCKETS = dict()
+_PREFETCH = 4
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=40, keepalive_expiry=30.0)
+_SHARED_SESSION = None
+_SHARED_SESSION_KEY = None
+_CACHE = None
+_CACHE_DIR = None
+_RETRIES = 3
+_RETRY_DELAY = 0.3
+# Часовой пояс биржи (Москва, UTC+3 без перехода на летнее время): торговый день закрывается по нему
+_MSK = timezone(timedelta(hours=3))
+
+
+class _TokenBucket:
+    """
+    Ограничитель частоты запросов (token bucket).
+
+    Токены пополняются со скоростью `rate` в секунду, но не больше `capacity`.
+    Запрос резервирует токен и ждет, если токенов не осталось.
+
+    Attributes
+    ----------
+    rate : float
+        Количество запросов в секунду.
+    capacity : int
+        Максимальное количество запросов, выполняемых без ожидания.
+    """
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Резервирует токен для запроса.
+
+        Returns
+        -------
+        return : float
+            Время ожидания (в секундах) до выполнения запроса.
+        """
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+def _bucket_for(base_url: str, authorized: bool) -> _TokenBucket:
+    """
+    Ограничитель частоты запросов для сервера и режима авторизации.
+
+    Parameters
+    ----------
+    base_url : str
+        Базовый URL.
+    authorized : bool
+        Авторизован ли клиент.
+
+    Returns
+    -------
+    return : _TokenBucket
+        Ограничитель частоты запросов.
+    """
+    key = (base_url, authorized)
+    if (bucket := _BUCKETS.get(key)) is None:
+        bucket = _BUCKETS.setdefault(key, _TokenBucket(_REQUEST_RATE, _REQUEST_BURST))
+    return bucket
+
+
+@lru_cache(maxsize=512)
+def _path_url(path: str) -> str:
+    """
+    Адрес запроса для пути к объектам: без пустых сегментов и с суффиксом `.json`.
+
+    Parameters
+    ----------
+    path : str
+        Путь к объектам.
+
+    Returns
+    -------
+    return : str
+        Адрес запроса.
+    """
+    return '/'.join(item for item in path.split('/') if item.strip()) + '.json'
+
+
+def _response_cache(url: str,
+                    params: dict,
+                    base_url: str,
+                    authorized: bool) -> tuple[Optional[diskcache.Cache], Optional[bytes]]:
+    """
+    Дисковый кеш ответа ISS и ключ запроса.
+
+    Кеш включается заданием `CACHE_DIR` и используется только для запросов за прошедшие
+    даты (`till` или `date` раньше сегодняшнего дня по московскому времени), ответы на которые
+    больше не меняются. Ответы разных серверов (ISS, APIM) и ответы с авторизацией и без нее кешируются отдельно.
+
+    Parameters
+    ----------
+    url : str
+        Адрес запроса относительно базового URL.
+    params : dict
+        Параметры запроса.
+    base_url : str
+        Базовый URL клиента.
+    authorized : bool
+        Выполняется ли запрос с авторизацией.
+
+    Returns
+    -------
+    return : tuple[Optional[diskcache.Cache], Optional[bytes]]
+        Кеш и ключ запроса или (None, None), если ответ не кешируется.
+    """
+    global _CACHE, _CACHE_DIR
+    till = params.get('till') or params.get('date')
+    if CACHE_DIR is None or not isinstance(till, str) or till[:10] >= datetime.now(_MSK).date().isoformat():
+        return None, None
+    if _CACHE is None or _CACHE_DIR != CACHE_DIR:
+        _CACHE, _CACHE_DIR = diskcache.Cache(CACHE_DIR), CACHE_DIR
+    key = f'{base_url}/{url}?{sorted(params.items())!r}#{int(authorized)}'
+    key = hashlib.blake2b(key.encode(), digest_size=16).digest()
+    return _CACHE, key
+
+
+@lru_cache(maxsize=16)
+def _resolve_base_url(base_url: str, use_https: bool) -> tuple[str, bool]:
+    """
+    Базовый URL с учетом `USE_HTTPS`.
+
+    Parameters
+    ----------
+    base_url : str
+        Базовый URL.
+    use_https : bool
+        Используется ли HTTPS.
+
+    Returns
+    -------
+    return : tuple[str, bool]
+        Базовый URL и признак перехода с HTTPS на HTTP (без проверки сертификата).
+    """
+    if base_url.startswith('http:') and use_https:
+        return base_url.replace('http:', 'https:'), False
+    if base_url.startswith('https:') and not use_https:
+        return base_url.replace('https:', 'http:'), True
+    return base_url, False
 
 
 class HasOptions:
@@ -45,18 +217,15 @@ class HasOptions:
         -------
         return : None
         """
-        global TOKEN
         base_url = base_url or BASE_URL
         if TOKEN:
             base_url = TOKEN_URL
             if 'headers' not in options:
                 options['headers'] = []
-            if not [name for name, _ in options['headers'] if name=='Authorization']:
+            if not any(name == 'Authorization' for name, _ in options['headers']):
                 options['headers'].append(('Authorization', f'Bearer {TOKEN}'))
-        if base_url.startswith('http:') and USE_HTTPS:
-            base_url = base_url.replace('http:', 'https:')
-        elif base_url.startswith('https:') and not USE_HTTPS:
-            base_url = base_url.replace('https:', 'http:')
+        base_url, insecure = _resolve_base_url(base_url, USE_HTTPS)
+        if insecure:
             options['verify'] = False
 
         self.__options = dict(**options, base_url=base_url, timeout=timeout)
@@ -105,6 +274,9 @@ class Client(HasOptions):
         """
         options.update(follow_redirects = True,
                        headers = [('User-Agent', 'python-httpx/moexalgo')])
+        # HTTP/2 позволяет запрашивать несколько страниц по одному соединению
+        options.setdefault('http2', _HTTP2)
+        options.setdefault('limits', _LIMITS)
         super().__init__(**options)
         self.httpx_cli = httpx.Client(**self.options) if sync else httpx.AsyncClient(**self.options)
 
@@ -218,7 +390,23 @@ class Client(HasOptions):
             Вызывается, если получен неверный ответ.
         """
 
-        global _NEXT_REQUEST_AT
+        def _parse_content(content: bytes) -> Union[dict, list]:
+            """
+            Парсинг содержимого ответа.
+
+            Parameters
+            ----------
+            content : bytes
+                Содержимое ответа в формате JSON.
+
+            Returns
+            -------
+            return : Union[dict, list]
+                Объекты или список объектов.
+            """
+            if data := json.loads(content):
+                return deserializer(data)
+            raise ValueError('Received wrong data')
 
         def _parse_response(resp: httpx.Response) -> Union[dict, list]:
             """
@@ -239,9 +427,26 @@ class Client(HasOptions):
             if not resp.headers['content-type'].startswith('application/json'):
                 resp.status_code = 403
                 resp.raise_for_status()
-            if data := json.loads(resp.text):
-                return deserializer(data)
-            raise ValueError('Received wrong data')
+            result = _parse_content(resp.content)
+            if cache is not None:
+                cache.set(key, resp.content)
+            return result
+
+        async def _async_from_cache(content: bytes) -> Union[dict, list]:
+            """
+            Асинхронное получение объектов из дискового кеша.
+
+            Parameters
+            ----------
+            content : bytes
+                Содержимое ответа из кеша в формате JSON.
+
+            Returns
+            -------
+            return : Union[dict, list]
+                Объекты или список объектов.
+            """
+            return _parse_content(content)
 
         async def _async_get_objects(timeout: float) -> Union[dict, list]:
             """
@@ -259,7 +464,13 @@ class Client(HasOptions):
             """
             if timeout:
                 await asyncio.sleep(timeout)
-            return _parse_response(await self.httpx_cli.get(url, params=params))
+            for attempt in range(1, _RETRIES + 1):
+                try:
+                    return _parse_response(await self.httpx_cli.get(url, params=params))
+                except httpx.TransportError:
+                    if attempt == _RETRIES:
+                        raise
+                    await asyncio.sleep(_RETRY_DELAY * attempt)
 
         def _sync_get_objects(timeout: float) -> Union[dict, list]:
             """
@@ -277,15 +488,23 @@ class Client(HasOptions):
             """
             if timeout:
                 sleep(timeout)
-            return _parse_response(self.httpx_cli.get(url, params=params))
+            for attempt in range(1, _RETRIES + 1):
+                try:
+                    return _parse_response(self.httpx_cli.get(url, params=params))
+                except httpx.TransportError:
+                    if attempt == _RETRIES:
+                        raise
+                    sleep(_RETRY_DELAY * attempt)
 
-        path = [item for item in path.split('/') if item.strip()]
-        url = '/'.join(path) + '.json'
+        url = _path_url(path)
 
-        timeout = _NEXT_REQUEST_AT - time()
-        if self.authorized or timeout <= 0:
-            timeout = 0.2
-        _NEXT_REQUEST_AT = time() + _REQUEST_TIMEOUT + timeout
+        # `authorized` не учитывает сертификат, переданный через cookies сессии
+        authorized = self.authorized or 'MicexPassportCert' in self.options.get('cookies', {})
+        cache, key = _response_cache(url, params, self.options['base_url'], authorized)
+        if cache is not None and (content := cache.get(key)) is not None:
+            return _parse_content(content) if self.sync else _async_from_cache(content)
+
+        timeout = _bucket_for(self.options['base_url'], self.authorized).reserve()
 
         return _sync_get_objects(timeout) if self.sync else _async_get_objects(timeout)
 
@@ -338,24 +557,34 @@ class Session(HasOptions):
             options.update(cs.options)
         super().__init__(**options)
         self._client = None
+        self._entered = 0
+        # Вход и выход из общей сессии возможны из разных потоков (например, в `Tickers`)
+        self._lock = threading.Lock()
 
     def __enter__(self) -> Client:
         """
         Вход в сессию.
 
+        Повторный вход возвращает уже открытый синхронный клиент, соединения не пересоздаются.
+
         Returns
         -------
         return : Client
             Клиент для работы с API.
         """
-        self._client = Client(True, **self.options)
-        self._client.httpx_cli.__enter__()
-        return self._client
+        with self._lock:
+            if not (self._entered > 0 and self._client.sync):
+                self._client = Client(True, **self.options)
+                self._client.httpx_cli.__enter__()
+            self._entered += 1
+            return self._client
 
     def __exit__(self, *exc_info) -> bool:
         """
         Выход из сессии.
 
+        Клиент закрывается только при выходе из последнего вложенного контекста.
+
         Parameters
         ----------
         exc_info : tuple
@@ -366,7 +595,12 @@ class Session(HasOptions):
         return : bool
             `True`, если исключение обработано, иначе `False`.
         """
-        return self._client.httpx_cli.__exit__(*exc_info)
+        with self._lock:
+            self._entered -= 1
+            if self._entered > 0:
+                return False
+            client, self._client = self._client, None
+        return client.httpx_cli.__exit__(*exc_info)
 
     async def __aenter__(self) -> Client:
         """
@@ -382,7 +616,8 @@ class Session(HasOptions):
         return self._client
 
     async def __aexit__(self, *exc_info):
-        return await self._client.httpx_cli.__aexit__(*exc_info)
+        client, self._client = self._client, None
+        return await client.httpx_cli.__aexit__(*exc_info)
 
 
 def authorize(username: str, password: str) -> bool:
@@ -409,6 +644,71 @@ def authorize(username: str, password: str) -> bool:
         return False
 
 
+def install_uvloop() -> bool:
+    """
+    Устанавливает `uvloop` в качестве цикла событий `asyncio`, если он установлен.
+
+    Ускоряет асинхронный режим работы (`async with Session(...)`).
+    Вызывается явно до запуска цикла событий, так как меняет политику `asyncio` для всего процесса.
+
+    Returns
+    -------
+    return : bool
+        `True`, если `uvloop` установлен, иначе `False`.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def shared_session(cs: HasOptions = None) -> Session:
+    """
+    Сессия для выполнения запросов.
+
+    Если `cs` не задана, возвращается общая сессия, клиент которой остается открытым
+    между вызовами, что позволяет переиспользовать соединения из пула.
+    Переданная `Session` используется как есть, без создания новой сессии и клиента,
+    если она не открыта через `async with`, иначе ее опции передаются новой сессии.
+    Общая сессия пересоздается при изменении `AUTH_CERT`, `TOKEN`, `USE_HTTPS` или `BASE_URL`.
+
+    Parameters
+    ----------
+    cs : HasOptions, optional
+        Сессия, из которой будут взяты опции, by default None.
+
+    Returns
+    -------
+    return : Session
+        Сессия клиента.
+    """
+    global _SHARED_SESSION, _SHARED_SESSION_KEY
+    if isinstance(cs, Session) and (cs._client is None or cs._client.sync):
+        return cs
+    if cs is not None:
+        return Session(cs)
+    key = (AUTH_CERT, TOKEN, USE_HTTPS, BASE_URL)
+    if _SHARED_SESSION is None or _SHARED_SESSION_KEY != key:
+        _close_shared_session()
+        _SHARED_SESSION = Session(auth_cert=AUTH_CERT)
+        _SHARED_SESSION_KEY = key
+        _SHARED_SESSION.__enter__()
+    return _SHARED_SESSION
+
+
+@atexit.register
+def _close_shared_session() -> None:
+    """
+    Закрывает общую сессию и ее соединения при завершении интерпретатора.
+    """
+    global _SHARED_SESSION, _SHARED_SESSION_KEY
+    if _SHARED_SESSION is not None:
+        _SHARED_SESSION.__exit__(None, None, None)
+    _SHARED_SESSION = _SHARED_SESSION_KEY = None
+
+
 def __getattr__(name: str) -> Session:
     """
     Получение сессии по имени.
@@ -436,6 +736,10 @@ def data_gen(cs: Session,
     """
     Генератор данных.
 
+    Страницы запрашиваются по очереди, пока две подряд не вернут одинаковое количество строк.
+    После этого размер страницы считается известным, и следующие страницы
+    (не более `_PREFETCH`) запрашиваются заранее, пока потребитель обрабатывает текущую.
+
     Parameters
     ----------
     cs : Session
@@ -448,6 +752,7 @@ def data_gen(cs: Session,
         Смещение данных.
     limit : int
         Лимит данных.
+        Если меньше нуля, то возвращается только первая страница, если равен нулю, то все данные.
     section : str, optional
         Секция данных, by default 'data'.
     
@@ -456,18 +761,87 @@ def data_gen(cs: Session,
     return : Optional[Iterator[dict]]
         Итератор с данными или None, если данных нет.
     """
-    start = offset
-    with Session(cs or Session(auth_cert=AUTH_CERT)) as client:
-        while True:
-            options['start'] = start
-            items = client.get_objects(path, lambda data: result_deserializer(data, section), **options)
-            if metrics := items.get(section):
-                for item in metrics:
-                    yield item
-                    start += 1
-                    if (start - offset) >= limit and limit > 0:
-                        return
-                if limit < 0:
+
+    def deserialize(data: dict) -> dict:
+        """
+        Десериализация секции данных из ответа ISS.
+
+        Parameters
+        ----------
+        data : dict
+            Словарь с данными от ISS.
+
+        Returns
+        -------
+        return : dict
+            Словарь с данными секции.
+        """
+        return result_deserializer(data, section)
+
+    def fetch(start: int) -> list[dict]:
+        """
+        Запрос одной страницы данных.
+
+        Parameters
+        ----------
+        start : int
+            Смещение страницы.
+
+        Returns
+        -------
+        return : list[dict]
+            Строки страницы или пустой список, если данных нет.
+        """
+        items = client.get_objects(path, deserialize, **dict(options, start=start))
+        return items.get(section) or []
+
+    def prefetch() -> None:
+        """
+        Запрос следующих страниц заранее, пока в очереди меньше `_PREFETCH` страниц
+        и не достигнут лимит.
+        """
+        nonlocal executor, next_start
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=_PREFETCH)
+        while len(pending) < _PREFETCH and (stop is None or next_start < stop):
+            pending.append(executor.submit(fetch, next_start))
+            next_start += page_size
+
+    with shared_session(cs) as client:
+        metrics = fetch(offset)
+        if limit < 0:
+            yield from metrics
+            return
+
+        stop = offset + limit if limit > 0 else None
+        page_size = None
+        pending = deque()
+        executor = None
+        start = offset
+        try:
+            while metrics:
+                if page_size is not None:
+                    prefetch()
+                if stop is not None and start + len(metrics) >= stop:
+                    yield from metrics[:stop - start]
+                    return
+                yield from metrics
+                start += len(metrics)
+                if page_size is None:
+                    size = len(metrics)
+                    metrics = fetch(start)
+                    if len(metrics) == size:
+                        # Первый ответ может быть короче страницы ISS, поэтому размер страницы
+                        # подтверждается второй страницей того же размера
+                        page_size = size
+                        next_start = start + size
+                elif len(metrics) < page_size or not pending:
                     return
-            else:
-                return
+                else:
+                    metrics = pending.popleft().result()
+        finally:
+            if executor is not None:
+                # `cancel_futures` у `shutdown` есть только с Python 3.9
+                for future in pending:
+                    future.cancel()
+                executor.shutdown(wait=True)
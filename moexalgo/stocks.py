@@ -1,14 +1,24 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Union
-
-import pandas as pd
+from typing import TYPE_CHECKING, Union
 
 from moexalgo.metrics import prepare_request, dataclass_it, pandas_frame
 from moexalgo.session import Session
 from moexalgo.tickers import _Ticker, _resolve_ticker
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Компактные типы столбцов `TradeStat`: цены в `float32`, количества сделок в `int32`.
+# Объемы в лотах по ликвидным бумагам могут превышать `int32`, поэтому остаются в `int64`
+_COMPACT_TRADESTATS = dict(
+    **{name: 'float32' for name in ('pr_open', 'pr_high', 'pr_low', 'pr_close', 'pr_std', 'pr_vwap',
+                                    'pr_change', 'pr_vwap_b', 'pr_vwap_s', 'disb')},
+    **{name: 'int32' for name in ('trades', 'trades_b', 'trades_s')},
+    **{name: 'int64' for name in ('vol', 'vol_b', 'vol_s')}
+)
+
 
 class Stock(_Ticker):
     """
@@ -84,7 +94,8 @@ class Stock(_Ticker):
                         latest: bool = None,
                         offset: int = None,
                         cs: Session = None,
-                        use_dataframe: bool = True) -> Union[iter, pd.DataFrame]:
+                        use_dataframe: bool = True,
+                        dtypes: dict[str, str] = None) -> Union[iter, pd.DataFrame]:
         """
         Подготовка метрик.
 
@@ -107,6 +118,8 @@ class Stock(_Ticker):
         use_dataframe : bool, optional
             Изменяет тип возвращаемого объекта, by default `True`.
             Если `True`, то возвращает `pd.DataFrame`, иначе итератор.
+        dtypes : dict[str, str], optional
+            Типы числовых столбцов `pd.DataFrame`, by default None.
 
         Returns
         ----------
@@ -122,7 +135,7 @@ class Stock(_Ticker):
             latest=latest,
             offset=offset
         )
-        return pandas_frame(metrics_it) if use_dataframe else dataclass_it(metrics_it)
+        return pandas_frame(metrics_it, dtypes) if use_dataframe else dataclass_it(metrics_it)
 
     def tradestats(self, 
                    *, 
@@ -131,7 +144,8 @@ class Stock(_Ticker):
                    latest: bool = None, 
                    offset: int = None,
                    cs: Session = None, 
-                   use_dataframe: bool = True) -> Union[iter, pd.DataFrame]:
+                   use_dataframe: bool = True,
+                   compact: bool = False) -> Union[iter, pd.DataFrame]:
         """
         Возвращает метрики `TradeStat` (статистику по сделкам) по заданным параметрам.
         Больше информации о метрике `TradeStat` можно найти на странице: https://moexalgo.github.io/des/supercandles/#tradestats
@@ -151,6 +165,9 @@ class Stock(_Ticker):
         use_dataframe : bool, optional
             Изменяет тип возвращаемого объекта, by default `True`.
             Если `True`, то возвращает `pd.DataFrame`, иначе итератор.
+        compact : bool, optional
+            Использовать компактные типы столбцов `pd.DataFrame`, by default `False`.
+            Если `True`, то цены хранятся в `float32`, а количества сделок в `int32`.
         
         Returns
         ----------
@@ -165,7 +182,8 @@ class Stock(_Ticker):
             latest,
             offset,
             cs,
-            use_dataframe
+            use_dataframe,
+            _COMPACT_TRADESTATS if compact else None
         )
 
     def orderstats(self, 
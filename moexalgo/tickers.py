@@ -1,19 +1,30 @@
 from __future__ import annotations
 import typing as t
 
-from datetime import date, datetime
+from datetime import date
+from functools import lru_cache
 import re
 from typing import Union
 import weakref
 
 from moexalgo import trades
-from moexalgo.requests import get_secid_info_and_boards
+from moexalgo.requests import clear_security_cache, get_secid_info_and_boards, security_period
 from moexalgo.candles import Candle, prepare_request, pandas_frame, dataclass_it
 from moexalgo.market import Market
-from moexalgo.metrics import prepare_market_request, dataclass_it as dict_it
+from moexalgo.metrics import FUTOI_DTYPES, current_date, prepare_market_request, dataclass_it as dict_it
 from moexalgo.session import Session, data_gen
 from moexalgo.utils import pd, CandlePeriod
 
+# Типы числовых столбцов свечей, стакана и сделок, передаются в `pd.DataFrame` без определения типа
+_CANDLES_DTYPES = {'open': 'float64', 'close': 'float64', 'high': 'float64', 'low': 'float64',
+                   'value': 'float64', 'volume': 'float64'}
+_ORDERBOOK_DTYPES = {'price': 'float64', 'quantity': 'int64', 'seqnum': 'int64', 'decimals': 'int64',
+                     'buysell': 'category'}
+_TRADES_DTYPES = {'tradeno': 'int64', 'price': 'float64', 'quantity': 'int64', 'value': 'float64',
+                  'decimals': 'int64'}
+# Разделитель идентификатора инструмента и режима торгов, например `SBER.TQBR`
+_SECID_SPLIT = re.compile('[^a-zA-Z0-9-]')
+
 
 class _Ticker:
     """
@@ -27,8 +38,8 @@ class _Ticker:
         Идентификатор инструмента.
     _boardid : str
         Идентификатор рынка.
-    _r_market : weakref.ref
-        Ссылка на объект рынка.
+    _market : Market
+        Раздел рынка, в который входит инструмент.
 
     Methods
     -------
@@ -73,9 +84,12 @@ class _Ticker:
 
     _secid: str
     _boardid: str
+    _market: Market
     _delisted: bool
-    _sec_info: dict[str, t.Any] = dict()
+    _sec_info: dict[str, t.Any]
     _board_info: dict[str, t.Any] = dict()
+    # Созданные объекты по `(cls, secid, boardid, market)`, пока на них есть ссылки
+    _instances: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
 
     def __new__(cls, secid: str, boardid: str = None, market: str = None,
                 engine: str = None, description: dict = None, board_info: dict = None) -> _Ticker:
@@ -102,34 +116,37 @@ class _Ticker:
             else:
                 raise LookupError(f"Cannot found ticker: `{secid}`")
 
+        key = (cls, secid, boardid, market)
+        if (instance := _Ticker._instances.get(key)) is not None and instance._board_info is board_info:
+            return instance
+
         market = Market(market, boardid)
         instance = super().__new__(cls)
         instance._secid = secid
         instance._boardid = market._boardid
-        instance._r_market = weakref.ref(market)
+        instance._market = market
         instance._sec_info = description
         instance._board_info = board_info
+        if board_info is not None:
+            _Ticker._instances[key] = instance
         return instance
 
+    @classmethod
+    def cache_clear(cls) -> None:
+        """
+        Очищает кеш разрешения тикеров, описаний инструментов и созданных объектов инструментов.
+        """
+        _cached_ticker.cache_clear()
+        clear_security_cache()
+        _Ticker._instances.clear()
+
     @property
     def delisted(self) -> bool:
-        return not self._board_info['listed_from'] <= datetime.now().date() <= self._board_info['listed_till']
+        return not self._board_info['listed_from'] <= current_date() <= self._board_info['listed_till']
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}('{self._secid}/{self._boardid}')"
 
-    @property
-    def _market(self) -> Market:
-        """
-        Раздел рынка в который входит инструмент.
-
-        Returns
-        -------
-        Market
-            Раздел рынка.
-        """
-        return self._r_market()
-
     def info(self, *fields: tuple[str], use_dataframe: bool = True) -> Union[dict, pd.DataFrame]:
         """
         Возвращает информацию об инструменте, словарь или `pd.DataFrame`
@@ -269,7 +286,7 @@ class _Ticker:
             offset=offset,
             latest=latest
         )
-        return pandas_frame(candles_it) if use_dataframe else dataclass_it(candles_it)
+        return pandas_frame(candles_it, _CANDLES_DTYPES) if use_dataframe else dataclass_it(candles_it)
 
     def orderbook(self, cs: Session = None, use_dataframe: bool = True) -> Union[iter, pd.DataFrame]:
         """
@@ -299,7 +316,7 @@ class _Ticker:
             limit=-1,
             section='orderbook'
         )
-        return pandas_frame(orderbook_it) if use_dataframe else dataclass_it(orderbook_it)
+        return pandas_frame(orderbook_it, _ORDERBOOK_DTYPES) if use_dataframe else dataclass_it(orderbook_it)
 
     def futoi(
             self,
@@ -353,18 +370,7 @@ class _Ticker:
             # offset=offset,
             limit=-1
         )
-        return pandas_frame(metrics_it) if use_dataframe else dict_it(metrics_it)
-
-    @classmethod
-    def _get_sec_info(cls, secid: str):
-        if secid not in cls._sec_info:
-            rv = data_gen(None, f'securities/{secid}', {}, 0, 100, section='boards')
-            if found := [info for info in rv if info['is_primary'] == 1]:
-                cls._sec_info[secid] = found[0]
-        try:
-            return cls._sec_info[secid]
-        except KeyError:
-            raise LookupError(f"Cannot found ticker: `{secid}`")
+        return pandas_frame(metrics_it, FUTOI_DTYPES) if use_dataframe else dict_it(metrics_it)
 
     def trades(self,
                 *,
@@ -397,16 +403,23 @@ class _Ticker:
             self._secid,
             tradeno=tradeno
         )
-        return pandas_frame(trades_it) if use_dataframe else trades.dataclass_it(trades_it)
+        return pandas_frame(trades_it, _TRADES_DTYPES) if use_dataframe else trades.dataclass_it(trades_it)
+
 
 def _resolve_ticker(secid: str, boardid: str = None) -> tuple[str, str, str, str, dict, dict]:
+    return _cached_ticker(secid, boardid, security_period())
+
+
+@lru_cache(maxsize=4096)
+def _cached_ticker(secid: str, boardid: str, period: int) -> tuple[str, str, str, str, dict, dict]:
+    # `period` меняется вместе с описаниями инструментов в кеше `get_security`,
+    # поэтому описание и `board_info` (например, `listed_till`) обновляются вместе с ними
     if boardid is None:
-        secid, *args = re.split('[^a-zA-Z0-9-]', secid)
+        secid, *args = _SECID_SPLIT.split(secid, maxsplit=2)
         if args:
             boardid = args[0]
     description, boards = get_secid_info_and_boards(secid)
-    if found := [board for name, board in boards.items() if board['is_primary']]:
-        board_info = found[0]
+    if board_info := next((board for board in boards.values() if board['is_primary']), None):
         if boardid:
             if boardid != board_info['boardid']:
                 raise ValueError("Wrong `boardid`")
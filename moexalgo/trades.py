@@ -5,8 +5,23 @@ from moexalgo.session import Session, data_gen
 
 
 def dataclass_it(it: Iterator) -> Iterator[dict]:
-    for items in it:
-        yield dict(**items)
+    """
+    Итератор сделок без преобразования.
+
+    Строки, которые выдает `data_gen`, уже являются новыми словарями,
+    поэтому поток возвращается как есть, без копирования каждой строки.
+
+    Parameters
+    ----------
+    it : Iterator
+        Итератор сделок.
+
+    Returns
+    -------
+    return : Iterator[dict]
+        Итератор сделок.
+    """
+    return it
 
 
 def prepare_request(cs: Session,
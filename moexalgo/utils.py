@@ -1,7 +1,14 @@
+from __future__ import annotations
+
 import decimal
+import importlib
 import json as _json
+import sys
+import warnings
 from datetime import datetime, date, time
 from enum import Enum
+from functools import lru_cache
+from typing import Any
 
 
 class ISSTickerParamException(Exception):
@@ -108,10 +115,92 @@ class RequiredImport:
         raise ImportError(f'Required `{self.__name}`')
 
 
+class LazyImport:
+    """
+    Класс для отложенного импорта библиотеки при первом обращении к ее атрибутам.
+
+    Attributes
+    ----------
+    __name : str
+        Название библиотеки (модуля).
+    __module : Any
+        Импортированный модуль или `RequiredImport`, если библиотека не установлена.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Parameters
+        ----------
+        name : str
+            Название библиотеки.
+
+        Returns
+        -------
+        return : None
+        """
+        self.__name = name
+        self.__module = None
+
+    def __getattr__(self, item: str) -> Any:
+        """
+        Parameters
+        ----------
+        item : str
+            Название атрибута.
+
+        Returns
+        -------
+        return : Any
+            Атрибут импортированного модуля.
+        """
+        if self.__module is None:
+            try:
+                self.__module = importlib.import_module(self.__name)
+            except ImportError:
+                self.__module = RequiredImport(self.__name)
+        return getattr(self.__module, item)
+
+
+# `pandas` импортируется только при первом построении `pd.DataFrame`
+pd = LazyImport('pandas')
+
 try:
-    import pandas as pd
+    import orjson as _orjson
 except ImportError:
-    pandas = RequiredImport('pandas')
+    _orjson = None
+
+# Преобразование в JSON по точному типу объекта
+_JSON_ENCODERS = {
+    decimal.Decimal: lambda obj: float(str(obj)),
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    time: time.isoformat
+}
+
+
+def _json_default(obj: object) -> object:
+    """
+    Параметры по умолчанию для преобразования объектов в JSON.
+
+    Parameters
+    ----------
+    obj : object
+        Объект данных.
+
+    Returns
+    -------
+    return : object
+        Объект данных.
+    """
+    if encoder := _JSON_ENCODERS.get(type(obj)):
+        return encoder(obj)
+    # Наследники поддерживаемых типов
+    if isinstance(obj, decimal.Decimal):
+        return float(str(obj))
+    elif isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+
+    raise TypeError
 
 
 class json:
@@ -121,13 +210,13 @@ class json:
     Attributes
     ----------
     loads : Callable
-        Загрузка JSON.
+        Загрузка JSON, используется `orjson`, если он установлен.
     JSONDecodeError : Exception
         Исключение при ошибке декодирования JSON.
     dumps : Callable
         Сохранение JSON.
     """
-    loads = _json.loads
+    loads = _orjson.loads if _orjson else _json.loads
     JSONDecodeError = _json.JSONDecodeError
 
     @staticmethod
@@ -146,28 +235,25 @@ class json:
             Строка JSON.
         """
 
-        def default(obj: object) -> object:
-            """
-            Параметры по умолчанию для преобразования объектов в JSON.
+        return _json.dumps(*args, **kwargs, default=_json_default)
 
-            Parameters
-            ----------
-            obj : object
-                Объект данных.
 
-            Returns
-            -------
-            return : object
-                Объект данных.
-            """
-            if isinstance(obj, decimal.Decimal):
-                return float(str(obj))
-            elif isinstance(obj, (datetime, date, time)):
-                return obj.isoformat()
-            
-            raise TypeError
+# Размер кеша разобранных дат и времени; значения повторяются в строках одного дня и между инструментами
+_TEMPORAL_CACHE_SIZE = 4096
 
-        return _json.dumps(*args, **kwargs, default=default)
+# Преобразование значений ISS по типу столбца из метаданных
+_CONVERTERS = {
+    # JSON уже возвращает числа, поэтому значение нужного типа возвращается без вызова `int`/`float`
+    'int32': lambda s: s if type(s) is int else int(s) if s is not None else None,
+    'int64': lambda s: s if type(s) is int else int(s) if s is not None else None,
+    'double': lambda s: s if type(s) is float else float(s) if s is not None else None,
+    'date': lru_cache(maxsize=_TEMPORAL_CACHE_SIZE)(
+        lambda s: date.fromisoformat(s.strip()) if (s is not None) and (s != '0000-00-00') else None),
+    'datetime': lru_cache(maxsize=_TEMPORAL_CACHE_SIZE)(
+        lambda s: datetime.fromisoformat(s.strip()) if s is not None else None),
+    'time': lru_cache(maxsize=_TEMPORAL_CACHE_SIZE)(
+        lambda s: time.fromisoformat(s.strip()) if s is not None else None)
+}
 
 
 def result_deserializer(data: dict, *sections, key: callable = None) -> dict:
@@ -191,10 +277,13 @@ def result_deserializer(data: dict, *sections, key: callable = None) -> dict:
     sections = sections or ('securities', 'marketdata')
     for section in sections:
         metadata = data[section]['metadata']
-        columns = data[section]['columns']
+        # Имена столбцов интернируются: ключи строк разных страниц и запросов - одни и те же объекты
+        columns = list(map(sys.intern, data[section]['columns']))
+        # Преобразователи определяются один раз для секции, а не для каждого значения
+        converters = [_CONVERTERS.get(metadata[column]['type'], str) for column in columns]
 
         for values in data[section]['data']:
-            item = item_normalizer(metadata, dict(zip(columns, values)))
+            item = {column: convert(value) for column, convert, value in zip(columns, converters, values)}
 
             if key:
                 result.setdefault(section, dict())[key(item)] = item
@@ -208,28 +297,21 @@ def item_normalizer(metadata: dict, item: dict) -> dict:
     """
     Нормализация данных.
 
+    .. deprecated::
+        Значения преобразуются в `result_deserializer`, функция оставлена для совместимости
+        и будет удалена в следующей версии.
+
     Parameters
     ----------
     metadata : dict
         Метаданные.
     item : dict
         Элемент данных.
-    
-    Notes
-    -----
-    `lambda s: …` - очень дорогая операция на больших данных без numpy.
 
     Returns
     -------
     return : dict
         Словарь с нормализованными данными.
     """
-    conv = {
-        'int32': lambda s: int(s) if s is not None else None,
-        'int64': lambda s: int(s) if s is not None else None,
-        'double': lambda s: float(s) if s is not None else None,
-        'date': lambda s: date.fromisoformat(s.strip()) if (s is not None) and (s != '0000-00-00') else None,
-        'datetime': lambda s: datetime.fromisoformat(s.strip()) if s is not None else None,
-        'time': lambda s: time.fromisoformat(s.strip()) if s is not None else None
-    }
-    return dict((key, conv.get(metadata[key]['type'], str)(value)) for key, value in item.items())
+    warnings.warn('`item_normalizer` is deprecated, use `result_deserializer`', DeprecationWarning, stacklevel=2)
+    return {key: _CONVERTERS.get(metadata[key]['type'], str)(value) for key, value in item.items()}
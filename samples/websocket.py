@@ -28,9 +28,9 @@ async def sample_websocket(url):
         # Отключение клиента через 50 сек
         asyncio.get_running_loop().call_later(50.0, lambda: asyncio.create_task(client.close()))
 
-        # вывод данных по подписке
-        async for data in subs:
-            print(data)
+        # вывод данных по подписке, накопившиеся сообщения выводятся одной записью
+        async for batch in subs.batches():
+            print('\n'.join(map(str, batch)))
         print(f'\n\n\n== UnSubscribe ({subs.id}): MXSE.securities, TICKER="MXSE.TQBR.GAZP" and LANGUAGE="en"  ===')
 
         await client  # Ожидание пока клиент активен
@@ -89,3 +89,10 @@ def test_futoi(datashop_apikey):
     assert futoi.ts.date() == _14_day
     assert 'pos_short' in futoi
     assert next(it)
+
+
+def test_token_base_url(monkeypatch):
+    monkeypatch.setattr(session, 'TOKEN', 'apikey')
+    options = session.Session(auth_cert='x').options
+    assert options['base_url'] == session.TOKEN_URL
+    assert ('Authorization', 'Bearer apikey') in options['headers']
@@ -0,0 +1,175 @@
+import asyncio
+from datetime import datetime
+
+import httpx
+import pytest
+
+from moexalgo import session
+from moexalgo.utils import result_deserializer
+
+
+def test_session_enter_after_async():
+    cs = session.Session(auth_cert=None)
+
+    async def use_async():
+        async with cs as client:
+            assert not client.sync
+
+    asyncio.run(use_async())
+    with cs as client:
+        assert client.sync
+        with cs as nested:
+            assert nested is client
+    assert cs._client is None
+
+
+def _fake_pages(monkeypatch, total, page_size):
+    requests = []
+
+    def get_objects(self, path, deserializer, **params):
+        requests.append(params['start'])
+        start = params['start']
+        return {'data': [{'n': n} for n in range(start, min(start + page_size, total))]}
+
+    monkeypatch.setattr(session.Client, 'get_objects', get_objects)
+    return requests
+
+
+def _rows_for(cs, offset, limit):
+    return [row['n'] for row in session.data_gen(cs, 'path', {}, offset, limit)]
+
+
+def _rows(offset, limit):
+    return _rows_for(session.Session(auth_cert=None), offset, limit)
+
+
+@pytest.mark.parametrize('total, offset, limit, rows, requests', [
+    # Результат умещается в одну страницу ISS: как и раньше, два запроса
+    (3, 0, 0, 3, [0, 3]),
+    (170, 0, 10_000, 170, [0, 170]),
+    (170, 0, -1, 170, [0]),
+    (170, 0, 1, 1, [0]),
+    (170, 100, 0, 70, [100, 170]),
+    # Вторая страница короче первой: страницы запрашиваются по очереди
+    (1500, 0, 0, 1500, [0, 1000, 1500]),
+    # Лимит покрывается первыми двумя страницами
+    (2500, 0, 1500, 1500, [0, 1000]),
+])
+def test_data_gen_requests(monkeypatch, total, offset, limit, rows, requests):
+    calls = _fake_pages(monkeypatch, total, 1000)
+    assert _rows(offset, limit) == list(range(offset, offset + rows))
+    assert calls == requests
+
+
+def test_data_gen_prefetch(monkeypatch):
+    calls = _fake_pages(monkeypatch, 25_000, 1000)
+    assert _rows(0, 10_000) == list(range(10_000))
+    # После двух полных страниц следующие запрашиваются заранее, но не дальше лимита
+    assert sorted(calls) == list(range(0, 10_000, 1000))
+
+    calls = _fake_pages(monkeypatch, 2500, 1000)
+    assert _rows(0, 0) == list(range(2500))
+    assert sorted(calls)[:3] == [0, 1000, 2000]
+    assert len(calls) <= 3 + session._PREFETCH
+
+
+def test_data_gen_inside_async_with(monkeypatch):
+    _fake_pages(monkeypatch, 3, 1000)
+    cs = session.Session(auth_cert=None)
+
+    async def use_async():
+        async with cs as client:
+            rows = _rows_for(cs, 0, 0)
+            assert cs._client is client
+        return rows
+
+    assert asyncio.run(use_async()) == [0, 1, 2]
+
+
+def test_shared_session_follows_base_url(monkeypatch):
+    monkeypatch.setattr(session, 'BASE_URL', 'https://iss.example.com/iss')
+    assert session.shared_session().options['base_url'] == 'https://iss.example.com/iss'
+    monkeypatch.setattr(session, 'BASE_URL', 'https://iss.example.org/iss')
+    assert session.shared_session().options['base_url'] == 'https://iss.example.org/iss'
+    session._close_shared_session()
+
+
+def _fake_http(monkeypatch, *results):
+    calls = []
+
+    def get(self, url, params=None):
+        calls.append((str(self.base_url), url, dict(params or {})))
+        result = results[min(len(calls), len(results)) - 1]
+        if isinstance(result, Exception):
+            raise result
+        return httpx.Response(200, headers={'content-type': 'application/json'}, json=result,
+                              request=httpx.Request('GET', url))
+
+    monkeypatch.setattr(httpx.Client, 'get', get)
+    monkeypatch.setattr(session._TokenBucket, 'reserve', lambda self: 0.0)
+    monkeypatch.setattr(session, '_RETRY_DELAY', 0.0)
+    return calls
+
+
+_PAGE = {'data': {'metadata': {'n': {'type': 'int32'}}, 'columns': ['n'], 'data': [[1]]}}
+
+
+def _get(cs, **params):
+    with cs as client:
+        return client.get_objects('path', lambda data: result_deserializer(data, 'data'), **params)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    pytest.importorskip('diskcache')
+    monkeypatch.setattr(session, 'CACHE_DIR', str(tmp_path))
+    return tmp_path
+
+
+def test_response_cache_hit(monkeypatch, cache_dir):
+    calls = _fake_http(monkeypatch, _PAGE)
+    cs = session.Session(auth_cert=None)
+    assert _get(cs, till='2020-01-01') == _get(cs, till='2020-01-01') == {'data': [{'n': 1}]}
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize('params', [
+    {},
+    {'till': datetime.now(session._MSK).date().isoformat()},
+    {'date': '2999-01-01'},
+])
+def test_response_cache_skips_open_days(monkeypatch, cache_dir, params):
+    calls = _fake_http(monkeypatch, _PAGE)
+    cs = session.Session(auth_cert=None)
+    _get(cs, **params)
+    _get(cs, **params)
+    assert len(calls) == 2
+
+
+def test_response_cache_key(monkeypatch, cache_dir):
+    calls = _fake_http(monkeypatch, _PAGE)
+    for options in [{'auth_cert': None}, {'auth_cert': 'cert'}, {'base_url': 'https://iss.example.com/iss'}]:
+        _get(session.Session(**options), till='2020-01-01')
+        _get(session.Session(**options), till='2020-01-01')
+    # Ответы разных серверов и ответы с авторизацией и без нее кешируются отдельно
+    assert len(calls) == 3
+
+
+def test_response_cache_disabled(monkeypatch):
+    monkeypatch.setattr(session, 'CACHE_DIR', None)
+    calls = _fake_http(monkeypatch, _PAGE)
+    cs = session.Session(auth_cert=None)
+    _get(cs, till='2020-01-01')
+    _get(cs, till='2020-01-01')
+    assert len(calls) == 2
+
+
+def test_transport_retries(monkeypatch):
+    calls = _fake_http(monkeypatch, httpx.ConnectError('down'), httpx.ConnectError('down'), _PAGE)
+    assert _get(session.Session(auth_cert=None)) == {'data': [{'n': 1}]}
+    assert len(calls) == session._RETRIES
+
+    calls = _fake_http(monkeypatch, httpx.ConnectError('down'))
+    with pytest.raises(httpx.ConnectError):
+        _get(session.Session(auth_cert=None))
+    assert len(calls) == session._RETRIES
@@ -1,5 +1,6 @@
 import pytest
-from moexalgo import Ticker, Market, Stock, Index, Futures, Currency
+import moexalgo
+from moexalgo import Ticker, Tickers, Market, Stock, Index, Futures, Currency
 from moexalgo.models.common import Candle
 
 
@@ -45,5 +46,23 @@ def test_tickers_iter():
     next(it)
 
 
+def test_tickers_batch(monkeypatch):
+    calls = []
+
+    def resolve_ticker(secid, boardid=None):
+        calls.append(secid)
+        return secid, 'TQBR', 'shares', 'stock', {}, {'boardid': 'TQBR', 'market': 'shares'}
+
+    monkeypatch.setattr(moexalgo, '_resolve_ticker', resolve_ticker)
+    sber, gazp, sber_again = Tickers('SBER', 'GAZP', 'SBER')
+    assert isinstance(sber, Stock) and isinstance(gazp, Stock)
+    assert (sber._secid, gazp._secid) == ('SBER', 'GAZP')
+    assert sber_again is sber
+    assert sorted(calls) == ['GAZP', 'SBER']
+
+    Ticker.cache_clear()
+    assert Tickers('SBER')[0] is not sber
+
+
 if __name__ == '__main__':
     pytest.main()